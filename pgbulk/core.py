@@ -1,3 +1,4 @@
+import functools
 import itertools
 from collections import UserString, namedtuple
 from typing import Iterable, List, Type, Union
@@ -40,6 +41,8 @@ elif psycopg_maj_version == 3:
     import psycopg.adapt
 
     class Literal:  # pragma: no cover
+        __slots__ = ("val",)
+
         def __init__(self, val):
             self.val = val
 
@@ -92,21 +95,59 @@ class UpsertResult(list):
     Also provides properties to access created and updated rows.
     """
 
+    @functools.cached_property
+    def _partitioned(self):
+        """
+        Partition rows into created and updated in a single pass. Safe to
+        cache since results are not mutated after construction.
+        """
+        created, updated = [], []
+        for row in self:
+            (created if row.status_ == "c" else updated).append(row)
+
+        return created, updated
+
     @property
     def created(self) -> List[namedtuple]:
         """Return the created rows"""
-        return [i for i in self if i.status_ == "c"]
+        return self._partitioned[0]
 
     @property
     def updated(self) -> List[namedtuple]:
         """Return the updated rows"""
-        return [i for i in self if i.status_ == "u"]
+        return self._partitioned[1]
 
 
+@functools.lru_cache(maxsize=None)
 def _quote(field):
     return '"{0}"'.format(field)
 
 
+@functools.lru_cache(maxsize=None)
+def _model_fields_by_name(model):
+    """
+    Get a mapping of a model's fields keyed by both attname and name,
+    memoized by model class since field reflection never changes at runtime.
+    """
+    return {
+        **{field.attname: field for field in model._meta.fields},
+        **{field.name: field for field in model._meta.fields},
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _auto_field_names(model):
+    """
+    Get the attnames of a model's auto_now and auto_now_add fields,
+    memoized by model class.
+    """
+    return tuple(
+        f.attname
+        for f in model._meta.fields
+        if getattr(f, "auto_now", False) or getattr(f, "auto_now_add", False)
+    )
+
+
 def _get_update_fields(queryset, to_update, exclude=None):
     """
     Get the fields to be updated in an upsert.
@@ -115,10 +156,7 @@ def _get_update_fields(queryset, to_update, exclude=None):
     """
     exclude = exclude or []
     model = queryset.model
-    fields = {
-        **{field.attname: field for field in model._meta.fields},
-        **{field.name: field for field in model._meta.fields},
-    }
+    fields = _model_fields_by_name(model)
 
     if to_update is None:
         to_update = [field.attname for field in model._meta.fields]
@@ -143,11 +181,7 @@ def _fill_auto_fields(queryset, values):
     have to be automatically constructed
     """
     model = queryset.model
-    auto_field_names = [
-        f.attname
-        for f in model._meta.fields
-        if getattr(f, "auto_now", False) or getattr(f, "auto_now_add", False)
-    ]
+    auto_field_names = _auto_field_names(model)
     now = timezone.now()
     for value in values:
         for f in auto_field_names:
@@ -199,64 +233,90 @@ def _sort_by_unique_fields(queryset, model_objs, unique_fields):
     return sorted(model_objs, key=sort_key)
 
 
-def _get_values_for_row(queryset, model_obj, all_fields):
+@functools.lru_cache(maxsize=None)
+def _get_row_placeholders(all_fields, using):
+    """
+    Get the placeholder rows for a VALUES clause, memoized by field tuple
+    and database alias. Only the first row carries explicit casts; every
+    other row is the same placeholder tuple.
+    """
+    connection = connections[using]
+    cast_row = "({0})".format(
+        ", ".join(["%s::{0}".format(f.db_type(connection)) for f in all_fields])
+    )
+    plain_row = "({0})".format(", ".join(["%s"] * len(all_fields)))
+    return cast_row, plain_row
+
+
+def _get_values_for_rows(queryset, model_objs, all_fields):
     connection = connections[queryset.db]
-    return [
+
+    cast_row, plain_row = _get_row_placeholders(tuple(all_fields), queryset.db)
+    row_values_sql = ", ".join([cast_row] + [plain_row] * (len(model_objs) - 1))
+
+    sql_args = [
         # Convert field value to db value
         # Use attname here to support fields with custom db_column names
         _get_field_db_val(queryset, field, getattr(model_obj, field.attname), connection)
+        for model_obj in model_objs
         for field in all_fields
     ]
 
+    return row_values_sql, sql_args
 
-def _get_values_for_rows(queryset, model_objs, all_fields):
-    connection = connections[queryset.db]
-    row_values = []
-    sql_args = []
-
-    for i, model_obj in enumerate(model_objs):
-        sql_args.extend(_get_values_for_row(queryset, model_obj, all_fields))
-        if i == 0:
-            row_values.append(
-                "({0})".format(
-                    ", ".join(["%s::{0}".format(f.db_type(connection)) for f in all_fields])
-                )
-            )
-        else:
-            row_values.append("({0})".format(", ".join(["%s"] * len(all_fields))))
 
-    return row_values, sql_args
+# Constant RETURNING suffix reporting whether each row was created or updated
+_STATUS_CASE_SQL = ", CASE WHEN xmax = 0 THEN 'c' ELSE 'u' END AS status_"
 
 
 def _get_return_fields_sql(returning):
-    return_fields_sql = ", ".join(_quote(field) for field in returning)
-    return_fields_sql += ", CASE WHEN xmax = 0 THEN 'c' ELSE 'u' END AS status_"
-    return return_fields_sql
+    return ", ".join(_quote(field) for field in returning) + _STATUS_CASE_SQL
 
 
-def _get_upsert_sql(
-    queryset,
-    model_objs,
+@functools.lru_cache(maxsize=None)
+def _upsert_fields(model, unique_fields):
+    """
+    Get the fields used as upsert values, memoized by model class and
+    uniqueness constraint.
+
+    Use all fields except pk unless the uniqueness constraint is the pk field
+    """
+    return tuple(
+        field
+        for field in model._meta.fields
+        if field.column in unique_fields or not isinstance(field, models.AutoField)
+    )
+
+
+# Statement templates, compiled once at import and formatted per shape
+_UPSERT_SQL_TEMPLATE = (
+    " INSERT INTO {table_name} ({all_field_names_sql})"
+    " VALUES {row_values_sql}"
+    " ON CONFLICT ({unique_field_names_sql}) {on_conflict} {return_sql}"
+)
+
+_UPDATE_SQL_TEMPLATE = (
+    "UPDATE {table} "
+    "SET {update_fields_sql} "
+    "FROM (VALUES {values_sql}) AS new_values ({value_fields_sql}) "
+    'WHERE "{table}"."{pk_field}" = "new_values"."{pk_field}"'
+)
+
+
+def _build_upsert_skeleton(
+    model,
     unique_fields,
     update_fields,
     returning,
-    redundant_updates=False,
+    redundant_updates,
+    update_fields_expressions=None,
 ):
     """
-    Generates the postgres specific sql necessary to perform an upsert
-    (ON CONFLICT) INSERT INTO table_name (field1, field2)
-    VALUES (1, 'two')
-    ON CONFLICT (unique_field) DO UPDATE SET field2 = EXCLUDED.field2;
+    Build the upsert SQL, leaving a ``{row_values_sql}`` hole for the
+    parameterized VALUES rows. The rows are the only part of the statement
+    that varies between upserts of the same shape.
     """
-    model = queryset.model
-    update_expressions = {f: f.expression for f in update_fields if getattr(f, "expression", None)}
-
-    # Use all fields except pk unless the uniqueness constraint is the pk field
-    all_fields = [
-        field
-        for field in model._meta.fields
-        if field.column in unique_fields or not isinstance(field, models.AutoField)
-    ]
+    all_fields = _upsert_fields(model, tuple(unique_fields))
 
     all_field_names = [field.column for field in all_fields]
     returning = returning if returning is not True else [f.column for f in model._meta.fields]
@@ -266,23 +326,11 @@ def _get_upsert_sql(
     unique_fields = [model._meta.get_field(unique_field) for unique_field in unique_fields]
     update_fields = [model._meta.get_field(update_field) for update_field in update_fields]
 
-    row_values, sql_args = _get_values_for_rows(queryset, model_objs, all_fields)
-
     unique_field_names_sql = ", ".join([_quote(field.column) for field in unique_fields])
-    update_fields_expressions = {
-        field.column: f"EXCLUDED.{_quote(field.column)}" for field in update_fields
-    }
-    if update_expressions:
-        connection = connections[queryset.db]
-        compiler = SQLCompiler(query=queryset.query, connection=connection, using=queryset.using)
-        with connection.cursor() as cursor:
-            for field_name, expr in update_expressions.items():
-                expr = expr.resolve_expression(queryset.query, allow_joins=False, for_save=True)
-                val = cursor.mogrify(*expr.as_sql(compiler, connection))
-                if isinstance(val, bytes):  # Psycopg 2/3 return different types
-                    val = val.decode("utf-8")
-
-                update_fields_expressions[model._meta.get_field(field_name).column] = val
+    if update_fields_expressions is None:
+        update_fields_expressions = {
+            field.column: f"EXCLUDED.{_quote(field.column)}" for field in update_fields
+        }
 
     update_fields_sql = ", ".join(
         f"{_quote(field.column)} = {update_fields_expressions[field.column]}"
@@ -308,21 +356,102 @@ def _get_upsert_sql(
         else "DO NOTHING"
     )
 
-    row_values_sql = ", ".join(row_values)
-    sql = (
-        " INSERT INTO {table_name} ({all_field_names_sql})"
-        " VALUES {row_values_sql}"
-        " ON CONFLICT ({unique_field_names_sql}) {on_conflict} {return_sql}"
-    ).format(
+    return _UPSERT_SQL_TEMPLATE.format(
         table_name=model._meta.db_table,
         all_field_names_sql=all_field_names_sql,
-        row_values_sql=row_values_sql,
+        row_values_sql="{row_values_sql}",
         unique_field_names_sql=unique_field_names_sql,
         on_conflict=on_conflict,
         return_sql=return_sql,
     )
 
-    return sql, sql_args
+
+@functools.lru_cache(maxsize=512)
+def _get_upsert_skeleton(model, unique_fields, update_fields, returning, redundant_updates):
+    """
+    Cached upsert skeletons for upserts without update expressions. Update
+    expressions are rendered into the statement per call and cannot be
+    cached by shape.
+    """
+    return _build_upsert_skeleton(
+        model, unique_fields, update_fields, returning, redundant_updates
+    )
+
+
+def _get_upsert_sql(
+    queryset,
+    model_objs,
+    unique_fields,
+    update_fields,
+    returning,
+    cursor,
+    redundant_updates=False,
+):
+    """
+    Generates the postgres specific sql necessary to perform an upsert
+    (ON CONFLICT) INSERT INTO table_name (field1, field2)
+    VALUES (1, 'two')
+    ON CONFLICT (unique_field) DO UPDATE SET field2 = EXCLUDED.field2;
+
+    The cursor is only used to render update expressions; it is shared
+    with the execution in _fetch so compiling does not open a second one.
+    """
+    model = queryset.model
+    update_expressions = {f: f.expression for f in update_fields if getattr(f, "expression", None)}
+
+    if update_expressions:
+        update_field_columns = [
+            model._meta.get_field(update_field).column for update_field in update_fields
+        ]
+        update_fields_expressions = {
+            column: f"EXCLUDED.{_quote(column)}" for column in update_field_columns
+        }
+        connection = connections[queryset.db]
+        compiler = SQLCompiler(query=queryset.query, connection=connection, using=queryset.using)
+        for field_name, expr in update_expressions.items():
+            expr = expr.resolve_expression(queryset.query, allow_joins=False, for_save=True)
+            val = cursor.mogrify(*expr.as_sql(compiler, connection))
+            if isinstance(val, bytes):  # Psycopg 2/3 return different types
+                val = val.decode("utf-8")
+
+            update_fields_expressions[model._meta.get_field(field_name).column] = val
+
+        skeleton = _build_upsert_skeleton(
+            model,
+            unique_fields,
+            update_fields,
+            returning,
+            redundant_updates,
+            update_fields_expressions=update_fields_expressions,
+        )
+    else:
+        skeleton = _get_upsert_skeleton(
+            model,
+            tuple(unique_fields),
+            tuple(str(update_field) for update_field in update_fields),
+            returning if isinstance(returning, bool) else tuple(returning),
+            redundant_updates,
+        )
+
+    all_fields = _upsert_fields(model, tuple(unique_fields))
+    row_values_sql, sql_args = _get_values_for_rows(queryset, model_objs, all_fields)
+
+    # Fill the hole with str.replace since rendered update expressions may
+    # legitimately contain braces
+    return skeleton.replace("{row_values_sql}", row_values_sql), sql_args
+
+
+# Number of rows fetched per batch when reading RETURNING results
+_RESULT_BATCH_SIZE = 1000
+
+
+@functools.lru_cache(maxsize=128)
+def _get_result_type(columns):
+    """
+    Get the named tuple type for a returned result, memoized by the column
+    names since building a namedtuple class is expensive.
+    """
+    return namedtuple("Result", columns)
 
 
 def _fetch(
@@ -340,21 +469,23 @@ def _fetch(
     upserted = []
 
     if model_objs:
-        sql, sql_args = _get_upsert_sql(
-            queryset,
-            model_objs,
-            unique_fields,
-            update_fields,
-            returning,
-            redundant_updates=redundant_updates,
-        )
-
         with connection.cursor() as cursor:
+            sql, sql_args = _get_upsert_sql(
+                queryset,
+                model_objs,
+                unique_fields,
+                update_fields,
+                returning,
+                cursor,
+                redundant_updates=redundant_updates,
+            )
+
             sql_args = _prep_sql_args(queryset, connection, cursor, sql_args)
             cursor.execute(sql, sql_args)
             if cursor.description:
-                nt_result = namedtuple("Result", [col[0] for col in cursor.description])
-                upserted = [nt_result(*row) for row in cursor.fetchall()]
+                nt_result = _get_result_type(tuple(col[0] for col in cursor.description))
+                while rows := cursor.fetchmany(_RESULT_BATCH_SIZE):
+                    upserted.extend(map(nt_result._make, rows))
 
     return UpsertResult(upserted)
 
@@ -408,6 +539,28 @@ def _upsert(
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _get_update_sql_pieces(model, using, value_fields, update_fields):
+    """
+    Get the static pieces of a bulk update statement - the db types of the
+    value columns, the VALUES alias column list, and the SET column pairs -
+    memoized by model, database alias, and field set.
+    """
+    connection = connections[using]
+    db_types = tuple(model._meta.get_field(field).db_type(connection) for field in value_fields)
+
+    value_fields_sql = ", ".join(
+        '"{field}"'.format(field=model._meta.get_field(field).column) for field in value_fields
+    )
+
+    update_fields_sql = ", ".join(
+        '"{field}" = "new_values"."{field}"'.format(field=model._meta.get_field(field).column)
+        for field in update_fields
+    )
+
+    return db_types, value_fields_sql, update_fields_sql
+
+
 def update(
     queryset: Union[Type[models.Model], models.QuerySet],
     model_objs: Iterable[models.Model],
@@ -469,39 +622,19 @@ def update(
     if len(row_values) == 0 or len(update_fields) == 0:
         return []
 
-    db_types = [model._meta.get_field(field).db_type(connection) for field in value_fields]
-
-    value_fields_sql = ", ".join(
-        '"{field}"'.format(field=model._meta.get_field(field).column) for field in value_fields
-    )
-
-    update_fields_sql = ", ".join(
-        [
-            '"{field}" = "new_values"."{field}"'.format(field=model._meta.get_field(field).column)
-            for field in update_fields
-        ]
+    db_types, value_fields_sql, update_fields_sql = _get_update_sql_pieces(
+        model, queryset.db, tuple(value_fields), tuple(update_fields)
     )
 
-    values_sql = ", ".join(
-        [
-            "({0})".format(
-                ", ".join(
-                    [
-                        "%s::{0}".format(db_types[i]) if not row_number and i else "%s"
-                        for i, _ in enumerate(row)
-                    ]
-                )
-            )
-            for row_number, row in enumerate(row_values)
-        ]
+    # Only the first row carries explicit casts, and the leading pk column is
+    # never cast; every other row is the same placeholder tuple
+    cast_row = "({0})".format(
+        ", ".join(["%s"] + ["%s::{0}".format(db_type) for db_type in db_types[1:]])
     )
+    plain_row = "({0})".format(", ".join(["%s"] * len(value_fields)))
+    values_sql = ", ".join([cast_row] + [plain_row] * (len(row_values) - 1))
 
-    update_sql = (
-        "UPDATE {table} "
-        "SET {update_fields_sql} "
-        "FROM (VALUES {values_sql}) AS new_values ({value_fields_sql}) "
-        'WHERE "{table}"."{pk_field}" = "new_values"."{pk_field}"'
-    ).format(
+    update_sql = _UPDATE_SQL_TEMPLATE.format(
         table=model._meta.db_table,
         pk_field=model._meta.pk.column,
         update_fields_sql=update_fields_sql,